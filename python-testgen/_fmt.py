@@ -0,0 +1,93 @@
+"""
+Helpers shared by the fixture generators.
+
+format_v4/format_v6 turn address integers into the same text as str() of the
+corresponding ipaddress object, but go through the C formatters in socket where
+those agree with ipaddress.
+
+dumps_json/write_json produce the fixtures' JSON layout (json.dump with indent=2)
+through orjson when it is installed, and through the stdlib encoder otherwise.
+"""
+
+import ipaddress
+import json
+import platform
+import socket
+import struct
+import sys
+from datetime import datetime, timezone
+from typing import Any
+
+# orjson is optional, and only used on CPython: on PyPy the JIT-compiled stdlib
+# encoder is faster than going through orjson's cpyext bridge. The two agree byte
+# for byte only on ASCII output (orjson keeps insertion order unless asked to sort,
+# like json.dumps), so dumps_json falls back to the stdlib encoder otherwise.
+orjson = None
+if platform.python_implementation() == "CPython":
+    try:
+        import orjson
+    except ImportError:
+        pass
+
+# True when dumps_json is the C encoder; scripts with a faster hand-written layout
+# for the stdlib case check this
+FAST_JSON = orjson is not None
+
+# Fixture timestamp, taken once at start-up, in UTC with whole seconds
+GEN_AT = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+_V4_PACK = struct.Struct("!I").pack
+
+
+def format_v4(a: int) -> str:
+    """Same text as str(ipaddress.IPv4Address(a))."""
+    return socket.inet_ntoa(_V4_PACK(a))
+
+
+def format_v6(a: int) -> str:
+    """Same text as str(ipaddress.IPv6Address(a))."""
+    # inet_ntop writes addresses in ::/96 and ::ffff:0:0/96 (IPv4-compatible and
+    # -mapped) with a dotted-quad tail, which ipaddress does not; those stay on it
+    if a >> 32 in (0, 0xFFFF):
+        return str(ipaddress.IPv6Address(a))
+    return socket.inet_ntop(socket.AF_INET6, a.to_bytes(16, "big"))
+
+
+def dumps_json(obj: Any, sort_keys: bool = False) -> bytes:
+    """
+    Same bytes as json.dumps(obj, indent=2, sort_keys=sort_keys), UTF-8 encoded, for
+    any payload without floats (orjson spells exponents and non-finite values
+    differently; no fixture carries floats).
+    """
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | (orjson.OPT_SORT_KEYS if sort_keys else 0))
+        except orjson.JSONEncodeError:
+            # e.g. lone surrogates or integers wider than 64 bits, which json accepts
+            pass
+        else:
+            # orjson writes non-ASCII text as raw UTF-8 where json escapes it as \uXXXX
+            if data.isascii():
+                return data
+    return json.dumps(obj, indent=2, sort_keys=sort_keys).encode("utf-8")
+
+
+def write_json(path: str, obj: Any, sort_keys: bool = False) -> None:
+    """
+    Writes obj as json.dump(obj, f, indent=2, sort_keys=sort_keys) would. A path of
+    "-" writes to stdout instead, followed by a newline.
+    """
+    if orjson is not None:
+        data = dumps_json(obj, sort_keys)
+        if path == "-":
+            sys.stdout.buffer.write(data + b"\n")
+        else:
+            with open(path, "wb") as f:
+                f.write(data)
+    # The stdlib encoder streams its chunks straight to the destination
+    elif path == "-":
+        json.dump(obj, sys.stdout, indent=2, sort_keys=sort_keys)
+        sys.stdout.write("\n")
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, indent=2, sort_keys=sort_keys)
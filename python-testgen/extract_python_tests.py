@@ -6,11 +6,13 @@ Plain-Python (stdlib-only) tool that builds JSON CIDR/IP fixtures from
 CPython's ipaddress test data.
 
 It can either:
-  A) Download CPython's test_ipaddress.py from GitHub (default branch or tag)
+  A) Download CPython's test_ipaddress.py from GitHub (default branch or tag);
+     downloads are cached under ~/.cache/cidre-testgen and revalidated per run
   B) Read a local file you provide
 
 Then it computes structured JSON with expected results using the stdlib
-`ipaddress` module (no third-party deps).
+`ipaddress` module (no third-party deps). If `orjson` happens to be installed
+it is used to write the JSON files; the output is the same either way.
 
 Usage examples:
   # Download from CPython "main" branch and write fixtures to ./out
@@ -32,14 +34,44 @@ Outputs (in --out):
   INDEX.json
 """
 
-import argparse, ast, ipaddress as ip, json, os, re, sys, datetime, urllib.request, tempfile
+import argparse, ast, ipaddress as ip, json, os, re, socket, sys, urllib.error, urllib.request, tempfile
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Tuple
+from functools import lru_cache
+from typing import List, Tuple
+
+from _fmt import GEN_AT, format_v4, format_v6, write_json
 
 RAW_URL_TMPL = "https://raw.githubusercontent.com/python/cpython/{ref}/Lib/test/test_ipaddress.py"
 # --- add near your imports ---
 BITS = {4: 32, 6: 128}
 
+# Per-version address width and int -> text formatter, looked up once per network
+_FAMILY = {4: (32, format_v4), 6: (128, format_v6)}
+
+_IP_CHARS = re.compile(r'[0-9:/.a-fA-F]').search
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+@lru_cache(maxsize=None)
+def _net(s, strict=True):
+    # The same CIDR strings are parsed by several passes; parse each one only once
+    return ip.ip_network(s, strict=strict)
+
+@lru_cache(maxsize=None)
+def _addr(s):
+    return ip.ip_address(s)
+
+def _packed_hex(s):
+    # s already parsed with ipaddress, so inet_pton packs the same bytes in one C call;
+    # keep ipaddress as the fallback for spellings the platform parser rejects
+    try:
+        return socket.inet_pton(socket.AF_INET6 if ':' in s else socket.AF_INET, s).hex()
+    except OSError:
+        return _addr(s).packed.hex()
+
+def _supernet(n, new_prefix):
+    return n.supernet(new_prefix=new_prefix)
+
 def _first_child(n):
     # Return the first child by splitting one bit deeper
     return next(n.subnets(prefixlen_diff=1))
@@ -49,62 +81,87 @@ def _second_child(n):
     next(it)
     return next(it)
 
+def _pair_key(x):
+    return (x.version, int(x.network_address), x.prefixlen)
+
 def build_augmented_pairs(valid_networks):
     """Create deterministic pairs covering containment and disjoint adjacency."""
-    nets = [ip.ip_network(s, strict=True) for s in valid_networks]
+    nets = [_net(s) for s in valid_networks]
     pairs = []
 
     seen = set()
     def add_pair(a, b):
-        key = (str(min(a,b, key=lambda x:(x.version, int(x.network_address), x.prefixlen))),
-               str(max(a,b, key=lambda x:(x.version, int(x.network_address), x.prefixlen))))
+        # (version, network int, prefixlen) identifies a network, so the ordered
+        # pair of these tuples is a cheaper dedup key than the two CIDR strings
+        ka, kb = _pair_key(a), _pair_key(b)
+        key = (ka, kb) if ka <= kb else (kb, ka)
         if key not in seen:
             seen.add(key)
-            pairs.append({"a": str(a), "b": str(b)})
+            pairs.append((a, b))
 
     for n in nets:
-        # 1) Containment: n vs its parent (if aligned)
+        # Parent shared by the containment and sibling cases below
+        p = None
         if n.prefixlen > 0:
             try:
-                p = n.supernet(new_prefix=n.prefixlen - 1)
-                add_pair(n, p)  # should yield overlap + subnet_of
+                p = _supernet(n, n.prefixlen - 1)
             except ValueError:
                 pass  # misaligned (shouldn't happen with strict nets)
 
+        # 1) Containment: n vs its parent (if aligned)
+        if p is not None:
+            add_pair(n, p)  # should yield overlap + subnet_of
+
         # 2) Containment the other way: n vs one of its own children
         fam_max = BITS[n.version]
         if n.prefixlen + 1 <= fam_max:
             c = _first_child(n)
             add_pair(c, n)
 
-        # 3) Disjoint siblings: two children of the same parent
-        if n.prefixlen > 0:
-            try:
-                p = n.supernet(new_prefix=n.prefixlen - 1)
-                kids = list(p.subnets(new_prefix=n.prefixlen))
-                if len(kids) >= 2:
-                    add_pair(kids[0], kids[1])  # adjacent, disjoint
-            except ValueError:
-                pass
+        # 3) Disjoint siblings: two children of the same parent; n is one of them,
+        #    so only the other half needs to be built
+        if p is not None:
+            if n.network_address == p.network_address:
+                add_pair(n, _second_child(p))  # adjacent, disjoint
+            else:
+                add_pair(_first_child(p), n)
 
     return pairs
 
+@lru_cache(maxsize=None)
+def _span(n):
+    # First and last address of n as plain ints, computed once per network
+    return int(n.network_address), int(n.broadcast_address)
+
+def _relations(a, b):
+    """Overlap/containment record for a pair, decided on the cached integer spans."""
+    if a.version != b.version:
+        # Let ipaddress decide (and complain) about mixed families
+        return {"a": str(a), "b": str(b), "overlaps": a.overlaps(b),
+                "a_subnet_of_b": a.subnet_of(b), "b_subnet_of_a": b.subnet_of(a),
+                "a_supernet_of_b": a.supernet_of(b), "b_supernet_of_a": b.supernet_of(a)}
+    alo, ahi = _span(a)
+    blo, bhi = _span(b)
+    a_in_b = blo <= alo and ahi <= bhi
+    b_in_a = alo <= blo and bhi <= ahi
+    return {
+        "a": str(a),
+        "b": str(b),
+        "overlaps": alo <= bhi and blo <= ahi,
+        "a_subnet_of_b": a_in_b,
+        "b_subnet_of_a": b_in_a,
+        "a_supernet_of_b": b_in_a,
+        "b_supernet_of_a": a_in_b,
+    }
+
 def truth_table(pairs):
-    out = []
-    for pair in pairs:
-        a = ip.ip_network(pair["a"], strict=True)
-        b = ip.ip_network(pair["b"], strict=True)
-        out.append({
-            "a": str(a),
-            "b": str(b),
-            "overlaps": a.overlaps(b),
-            "a_subnet_of_b": a.subnet_of(b),
-            "b_subnet_of_a": b.subnet_of(a),
-            "a_supernet_of_b": a.supernet_of(b),
-            "b_supernet_of_a": b.supernet_of(a),
-        })
-    return out
+    # pairs carries the network objects themselves, so nothing is reparsed here
+    return [_relations(a, b) for a, b in pairs]
+
 
+def _dump(out_dir, name, obj):
+    # keys stay sorted so the fixtures are byte-stable
+    write_json(os.path.join(out_dir, name), obj, sort_keys=True)
 
 @dataclass
 class Meta:
@@ -113,28 +170,56 @@ class Meta:
     source_ref: str
     tool: str = "cidr_fixture_extractor_plain.py"
 
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "cidre-testgen")
+
 def download_test_file(ref: str) -> str:
+    """Fetch test_ipaddress.py for ref into a local cache, revalidating with a conditional GET."""
     url = RAW_URL_TMPL.format(ref=ref)
-    with urllib.request.urlopen(url) as resp:
-        content = resp.read().decode("utf-8")
-    fd, tmp = tempfile.mkstemp(prefix="test_ipaddress_", suffix=".py")
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    name = re.sub(r'[^A-Za-z0-9._-]', '_', ref)
+    path = os.path.join(CACHE_DIR, f"test_ipaddress_{name}.py")
+    meta_path = path + ".meta"
+
+    headers = {}
+    if os.path.isfile(path) and os.path.isfile(meta_path):
+        with open(meta_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=30) as resp:
+            content = resp.read().decode("utf-8")
+            validators = {"etag": resp.headers.get("ETag"),
+                          "last_modified": resp.headers.get("Last-Modified")}
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return path  # cached copy is still current
+        raise
+    except urllib.error.URLError:
+        if headers:
+            print(f"Could not reach {url}, using cached {path}", file=sys.stderr)
+            return path
+        raise
+
+    fd, tmp = tempfile.mkstemp(prefix="test_ipaddress_", suffix=".py", dir=CACHE_DIR)
     with os.fdopen(fd, "w", encoding="utf-8") as f:
         f.write(content)
-    return tmp
+    os.replace(tmp, path)
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(validators, f)
+    return path
 
 def collect_string_literals(py_path: str) -> List[Tuple[int, str]]:
     with open(py_path, "r", encoding="utf-8") as f:
         source = f.read()
     tree = ast.parse(source, filename=py_path)
-    out = []
-    class V(ast.NodeVisitor):
-        def visit_Constant(self, node):
-            if isinstance(node.value, str):
-                out.append((getattr(node, "lineno", -1), node.value))
-        def visit_Str(self, node):  # Py<3.8
-            out.append((getattr(node, "lineno", -1), node.s))
-    V().visit(tree)
-    return out
+    # ast.walk avoids a visitor method dispatch per node; note that it is breadth-first,
+    # so the result is not in file order
+    return [(node.lineno, node.value) for node in ast.walk(tree)
+            if isinstance(node, ast.Constant) and isinstance(node.value, str)]
 
 def classify_literals(lits):
     v4_addrs, v6_addrs = set(), set()
@@ -143,50 +228,48 @@ def classify_literals(lits):
     v4_ifaces, v6_ifaces = set(), set()
     invalids = set()
 
-    for _, s in lits:
-        s = s.strip()
+    # The corpus repeats the same literals many times; classify each one once
+    for s in {x.strip() for _, x in lits}:
         if not s:
             continue
-        if not re.search(r'[0-9:/\.a-fA-F]', s):
+        if not _IP_CHARS(s):
             continue
-
         # 🚫 Reject IPv6 zone indices (RFC 4007) early; ipaddress doesn't accept them
         if '%' in s:
             invalids.add(s)
             continue
 
+        # Without any separator nothing below can parse or count as invalid
+        if '/' not in s and ':' not in s and '.' not in s:
+            continue
+
         if '/' not in s:
             try:
-                a = ip.ip_address(s)
+                a = _addr(s)
                 (v4_addrs if a.version == 4 else v6_addrs).add(s)
                 continue
             except ValueError:
                 pass
 
         if '/' in s:
-            # Interfaces first (still no % allowed because of early guard)
+            # Parse as interface once (still no % allowed because of early guard);
+            # anything that is a loose network is also a valid interface, and it is
+            # a strict network exactly when no host bits are set
             try:
                 i = ip.ip_interface(s)
-                (v4_ifaces if i.version == 4 else v6_ifaces).add(str(i))
-            except ValueError:
-                pass
-
-            # Networks (strict), otherwise loose
-            try:
-                n = ip.ip_network(s, strict=True)
-                (v4_nets if n.version == 4 else v6_nets).add(str(n))
             except ValueError:
-                try:
-                    n = ip.ip_network(s, strict=False)
-                    (v4_nets_loose if n.version == 4 else v6_nets_loose).add(str(n))
-                except ValueError:
-                    invalids.add(s)
+                invalids.add(s)
                 continue
+            n = i.network
+            (v4_ifaces if i.version == 4 else v6_ifaces).add(str(i))
+            if i.ip == n.network_address:
+                (v4_nets if n.version == 4 else v6_nets).add(str(n))
             else:
-                continue
+                (v4_nets_loose if n.version == 4 else v6_nets_loose).add(str(n))
+            continue
 
         # Fallback: looks IP-ish but didn't parse
-        if re.search(r'[0-9a-fA-F]', s) and ('.' in s or ':' in s):
+        if not _HEX_DIGITS.isdisjoint(s) and ('.' in s or ':' in s):
             invalids.add(s)
 
     return {
@@ -198,69 +281,41 @@ def classify_literals(lits):
     }
 
 
-def find_network_pairs(strings: List[Tuple[int,str]]):
-    pairs = set()
-    byline = {}
-    for lineno, s in strings:
-        byline.setdefault(lineno, []).append(s)
-    for lineno, arr in byline.items():
-        nets = []
-        for s in arr:
-            s = s.strip()
-            if '/' in s:
-                try:
-                    n = ip.ip_network(s, strict=False)
-                    nets.append(str(n))
-                except ValueError:
-                    pass
-        for i in range(len(nets)):
-            for j in range(i+1, len(nets)):
-                a, b = nets[i], nets[j]
-                if a != b:
-                    pairs.add(tuple(sorted((a,b))))
-    return [{"a":a,"b":b} for a,b in sorted(pairs)]
-
 def normalize_interfaces_and_loose(v4_ifaces, v6_ifaces, v4_loose, v6_loose):
     cases = []
+    # Keep the parsed networks around so the augmentation below needs no reparse
+    unique_nets = {}
     for s in list(v4_ifaces)+list(v6_ifaces):
-        i = ip.ip_interface(s)
-        cases.append({"input": s, "expect_network": str(i.network)})
+        n = ip.ip_interface(s).network
+        net_str = str(n)
+        unique_nets.setdefault(net_str, n)
+        cases.append({"input": s, "expect_network": net_str})
     # ... existing code ...
     for s in list(v4_loose)+list(v6_loose):
-        n = ip.ip_network(s, strict=False)
-        cases.append({"input": s, "expect_network": str(n)})
+        n = _net(s, strict=False)
+        net_str = str(n)
+        unique_nets.setdefault(net_str, n)
+        cases.append({"input": s, "expect_network": net_str})
     # ... existing code ...
     # Augment with non-normalized host inputs for every network; the fixture may grow.
     # For each unique network, generate several host addresses within it that normalize back to the network.
-    unique_nets = {}
-    for c in cases:
-        try:
-            net = ip.ip_network(c["expect_network"], strict=True)
-            unique_nets[str(net)] = net
-        except Exception:
-            pass
     augmented = []
     for net_str, net in unique_nets.items():
+        total = net.num_addresses
         # Single-address networks cannot produce a distinct host input
-        if net.num_addresses <= 1:
+        if total <= 1:
             continue
-        total = net.num_addresses
         # Select representative offsets inside the network:
         # - first usable (1), small offset (min(5, last)), middle, last
         # These are safe for both IPv4 and IPv6; for IPv4, including the broadcast as input is fine for normalization.
-        last = int(total) - 1
-        offsets = {1, min(5, last), last // 2, last}
+        # Offset 0 (the middle of a two-address network) would be the network address itself, so drop it.
+        last = total - 1
+        offsets = {1, min(5, last), last // 2, last} - {0}
+        base = int(net.network_address)
+        fmt = _FAMILY[net.version][1]
         for off in sorted(offsets):
-            try:
-                host = net.network_address + off
-                # Skip if somehow equals the network address (off == 0), otherwise include
-                if host == net.network_address:
-                    continue
-                host_input = f"{host}/{net.prefixlen}"
-                augmented.append({"input": host_input, "expect_network": net_str})
-            except Exception:
-                # Be robust in case of any edge-case arithmetic or type issue
-                continue
+            host_input = f"{fmt(base + off)}/{net.prefixlen}"
+            augmented.append({"input": host_input, "expect_network": net_str})
     cases.extend(augmented)
     # ... existing code ...
     seen = set(); out = []
@@ -270,108 +325,131 @@ def normalize_interfaces_and_loose(v4_ifaces, v6_ifaces, v4_loose, v6_loose):
             out.append(c); seen.add(key)
     return out
 
+def _subnet_strs(width, fmt, base, prefixlen, new_prefix):
+    # Same strings as n.subnets(new_prefix=...), stepping over the integer range
+    # instead of constructing a network object per child
+    step = 1 << (width - new_prefix)
+    return [f"{fmt(base + k * step)}/{new_prefix}"
+            for k in range(1 << (new_prefix - prefixlen))]
+
 def subnet_cases(nets: List[str]):
     cases, errors = [], []
     for s in nets:
-        n = ip.ip_network(s, strict=True)
-        fam_max = 32 if n.version==4 else 128
+        n = _net(s)
+        fam_max, fmt = _FAMILY[n.version]
         p = n.prefixlen
+        base = int(n.network_address)
+        parent = str(n)
         for step in (1,2):
             np = p+step
             if np <= fam_max:
-                subs = [str(x) for x in n.subnets(prefixlen_diff=step)]
-                cases.append({"parent": str(n), "prefixlen_diff": step, "expect": subs})
+                subs = _subnet_strs(fam_max, fmt, base, p, np)
+                cases.append({"parent": parent, "prefixlen_diff": step, "expect": subs})
         if p+4 <= fam_max:
-            subs = [str(x) for x in n.subnets(new_prefix=p+4)]
-            cases.append({"parent": str(n), "new_prefix": p+4, "expect": subs})
+            subs = _subnet_strs(fam_max, fmt, base, p, p+4)
+            cases.append({"parent": parent, "new_prefix": p+4, "expect": subs})
         if p-1 >= 0:
-            errors.append({"parent": str(n), "new_prefix": p-1, "expect_error":"ValueError"})
-        errors.append({"parent": str(n), "new_prefix": fam_max+1, "expect_error":"ValueError"})
+            errors.append({"parent": parent, "new_prefix": p-1, "expect_error":"ValueError"})
+        errors.append({"parent": parent, "new_prefix": fam_max+1, "expect_error":"ValueError"})
     return cases, errors
 
+def _supernet_str(width, fmt, base, new_prefix):
+    # Same string as n.supernet(new_prefix=...): clear the host bits of the shorter prefix
+    return f"{fmt(base & ~((1 << (width - new_prefix)) - 1))}/{new_prefix}"
+
 def supernet_cases(nets: List[str]):
+    # Every input is a strict network, and supernet() to any shorter prefix only masks
+    # host bits, so it cannot fail; the cases are computed without the ipaddress call
     cases, errors = [], []
     for s in nets:
-        n = ip.ip_network(s, strict=True)
+        n = _net(s)
+        width, fmt = _FAMILY[n.version]
         p = n.prefixlen
+        base = int(n.network_address)
+        child = str(n)
         fam_min = 0
         if p > fam_min:
             target = p-1
-            try:
-                res = n.supernet(new_prefix=target)
-                cases.append({"child": str(n), "new_prefix": target, "expect": str(res)})
-            except ValueError:
-                errors.append({"child": str(n), "new_prefix": target, "expect_error":"ValueError","reason":"misaligned"})
+            cases.append({"child": child, "new_prefix": target, "expect": _supernet_str(width, fmt, base, target)})
         step = 2
         if p-step >= fam_min:
-            try:
-                res = n.supernet(prefixlen_diff=step)
-                cases.append({"child": str(n), "prefixlen_diff": step, "expect": str(res)})
-            except ValueError:
-                errors.append({"child": str(n), "prefixlen_diff": step, "expect_error":"ValueError","reason":"misaligned"})
-        try:
-            n.supernet(new_prefix=p+1)
-            errors.append({"child": str(n), "new_prefix": p+1, "expect_error":"ValueError"})
-        except ValueError:
-            errors.append({"child": str(n), "new_prefix": p+1, "expect_error":"ValueError"})
+            cases.append({"child": child, "prefixlen_diff": step, "expect": _supernet_str(width, fmt, base, p-step)})
+        # A longer "supernet" prefix is always rejected by ipaddress
+        errors.append({"child": child, "new_prefix": p+1, "expect_error":"ValueError"})
     return cases, errors
 
-def truth_table_pairs(pairs: List[Dict[str,str]]):
-    out = []
-    for pair in pairs:
-        a = ip.ip_network(pair["a"], strict=False)
-        b = ip.ip_network(pair["b"], strict=False)
-        rec = {
-            "a": str(a), "b": str(b),
-            "overlaps": a.overlaps(b),
-            "a_subnet_of_b": a.subnet_of(b),
-            "b_subnet_of_a": b.subnet_of(a),
-            "a_supernet_of_b": a.supernet_of(b),
-            "b_supernet_of_a": b.supernet_of(a)
-        }
-        out.append(rec)
-    return out
-
 def set_operations_examples(nets: List[str]):
-    nets_objs = [ip.ip_network(s, strict=True) for s in nets]
-    out = {"union": [], "intersection": [], "difference": []}
-    for a in nets_objs[:6]:
-        for b in nets_objs[:6]:
+    nets_objs = [_net(s) for s in nets]
+    meta = [(n, *_span(n)) for n in nets_objs[:6]]
+    # union/intersection are symmetric: compute them once per unordered pair and
+    # reuse the result for both (a, b) and (b, a)
+    sym = {}
+    for i, (a, alo, ahi) in enumerate(meta):
+        for j in range(i + 1, len(meta)):
+            b, blo, bhi = meta[j]
             if a.version != b.version or a == b:
                 continue
             collapsed = [str(x) for x in ip.collapse_addresses([a, b])]
-            start = min(a.network_address, b.network_address)
-            end   = max(a.broadcast_address, b.broadcast_address)
+            start = a.network_address if alo <= blo else b.network_address
+            end   = a.broadcast_address if ahi >= bhi else b.broadcast_address
             covering = [str(x) for x in ip.summarize_address_range(start, end)]
-            out["union"].append({"inputs":[str(a),str(b)],"collapse":collapsed,"covering":covering})
-            if a.overlaps(b):
-                start_i = max(a.network_address, b.network_address)
-                end_i   = min(a.broadcast_address, b.broadcast_address)
+            overlaps = alo <= bhi and blo <= ahi
+            if overlaps:
+                start_i = a.network_address if alo >= blo else b.network_address
+                end_i   = a.broadcast_address if ahi <= bhi else b.broadcast_address
                 inter = [str(x) for x in ip.summarize_address_range(start_i, end_i)]
             else:
                 inter = []
+            sym[i, j] = sym[j, i] = (collapsed, covering, overlaps, inter)
+
+    out = {"union": [], "intersection": [], "difference": []}
+    for i, (a, alo, ahi) in enumerate(meta):
+        for j, (b, blo, bhi) in enumerate(meta):
+            if (i, j) not in sym:
+                continue
+            collapsed, covering, overlaps, inter = sym[i, j]
+            out["union"].append({"inputs":[str(a),str(b)],"collapse":collapsed,"covering":covering})
             out["intersection"].append({"a":str(a),"b":str(b),"expect": inter})
-            if not a.overlaps(b):
+            if not overlaps:
                 diff = [str(a)]
             else:
                 left = []
-                if int(b.network_address) > int(a.network_address):
+                if blo > alo:
                     left += [str(x) for x in ip.summarize_address_range(
-                        a.network_address, ip.ip_address(int(b.network_address)-1))]
+                        a.network_address, b.network_address - 1)]
                 right = []
-                if int(b.broadcast_address) < int(a.broadcast_address):
+                if bhi < ahi:
                     right += [str(x) for x in ip.summarize_address_range(
-                        ip.ip_address(int(b.broadcast_address)+1), a.broadcast_address)]
+                        b.broadcast_address + 1, a.broadcast_address)]
                 diff = left + right
             out["difference"].append({"a":str(a),"b":str(b),"expect": diff})
     return out
 
+# Fixture passes that only read the classified literals; each returns the body of its
+# JSON file (everything except "meta") so they can run in worker processes
+def _normalization_fixture(data):
+    return {"cases": normalize_interfaces_and_loose(data["v4_ifaces"], data["v6_ifaces"],
+                                                    data["v4_nets_loose"], data["v6_nets_loose"])}
+
+def _subnetting_fixture(nets):
+    subs, sub_errs = subnet_cases(nets)
+    return {"cases": subs, "error_cases": sub_errs}
+
+def _supernetting_fixture(nets):
+    sups, sup_errs = supernet_cases(nets)
+    return {"cases": sups, "error_cases": sup_errs}
+
+def _overlaps_containment_fixture(nets):
+    return {"pairs": truth_table(build_augmented_pairs(nets))}
+
 def main():
     ap = argparse.ArgumentParser(description="Build JSON CIDR fixtures from CPython ipaddress tests (plain stdlib).")
     src = ap.add_mutually_exclusive_group(required=True)
     src.add_argument("--from-url", metavar="REF", help="CPython ref to download from (e.g. 'main', '3.12')")
     src.add_argument("--from-file", metavar="PATH", help="Local path to test_ipaddress.py")
     ap.add_argument("--out", default="../cidre/src/jvmTest/resources/pythontest", help="Output directory")
+    ap.add_argument("--jobs", type=int, default=1,
+                    help="Worker processes for the independent fixtures (1 = in-process, 0 = one per CPU)")
     args = ap.parse_args()
 
     if args.from_url:
@@ -384,7 +462,7 @@ def main():
         source_ref = "local"
 
     meta = Meta(source_file=os.path.abspath(py_path),
-                generated=datetime.datetime.utcnow().isoformat()+"Z",
+                generated=GEN_AT,
                 source_ref=source_ref)
 
     strings = collect_string_literals(py_path)
@@ -394,7 +472,7 @@ def main():
     parsing = {
         "meta": asdict(meta),
         "valid_addresses": {
-            s: ip.ip_address(s).packed.hex()
+            s: _packed_hex(s)
             for s in sorted(set(data["v4_addrs"] + data["v6_addrs"]))
         },
         "invalid_addresses": [],
@@ -407,37 +485,29 @@ def main():
         (parsing["invalid_network_like"] if '/' in s else parsing["invalid_addresses"]).append(s)
     for k in ("invalid_addresses","invalid_network_like"):
         parsing[k] = sorted(set(parsing[k]))
-    with open(os.path.join(args.out,"parsing.json"),"w",encoding="utf-8") as f:
-        json.dump(parsing,f,indent=2,sort_keys=True)
-
-    norm_cases = normalize_interfaces_and_loose(data["v4_ifaces"], data["v6_ifaces"],
-                                                data["v4_nets_loose"], data["v6_nets_loose"])
-    with open(os.path.join(args.out,"normalization.json"),"w",encoding="utf-8") as f:
-        json.dump({"meta": asdict(meta), "cases": norm_cases}, f, indent=2, sort_keys=True)
+    _dump(args.out, "parsing.json", parsing)
 
     nets_all = parsing["valid_networks"]
-    subs, sub_errs = subnet_cases(nets_all)
-    with open(os.path.join(args.out,"subnetting.json"),"w",encoding="utf-8") as f:
-        json.dump({"meta": asdict(meta), "cases": subs, "error_cases": sub_errs}, f, indent=2, sort_keys=True)
-
-    sups, sup_errs = supernet_cases(nets_all)
-    with open(os.path.join(args.out,"supernetting.json"),"w",encoding="utf-8") as f:
-        json.dump({"meta": asdict(meta), "cases": sups, "error_cases": sup_errs}, f, indent=2, sort_keys=True)
-
-    pairs = build_augmented_pairs(parsing["valid_networks"])
-    tt = truth_table(pairs)
-    with open(os.path.join(args.out, "overlaps_containment.json"), "w", encoding="utf-8") as f:
-        json.dump({"meta": asdict(meta), "pairs": tt}, f, indent=2, sort_keys=True)
-
-    setops = set_operations_examples(nets_all)
-    with open(os.path.join(args.out,"set_operations.json"),"w",encoding="utf-8") as f:
-        json.dump({"meta": asdict(meta), **setops}, f, indent=2, sort_keys=True)
+    fixtures = [
+        ("normalization.json", _normalization_fixture, data),
+        ("subnetting.json", _subnetting_fixture, nets_all),
+        ("supernetting.json", _supernetting_fixture, nets_all),
+        ("overlaps_containment.json", _overlaps_containment_fixture, nets_all),
+        ("set_operations.json", set_operations_examples, nets_all),
+    ]
+    if args.jobs == 1:
+        bodies = [build(arg) for _, build, arg in fixtures]
+    else:
+        with ProcessPoolExecutor(max_workers=args.jobs or None) as ex:
+            futures = [ex.submit(build, arg) for _, build, arg in fixtures]
+            bodies = [fut.result() for fut in futures]
+    for (name, _, _), body in zip(fixtures, bodies):
+        _dump(args.out, name, {"meta": asdict(meta), **body})
 
     index = {"meta": asdict(meta),
              "files": ["parsing.json","normalization.json","subnetting.json","supernetting.json",
                        "overlaps_containment.json","set_operations.json"]}
-    with open(os.path.join(args.out,"INDEX.json"),"w",encoding="utf-8") as f:
-        json.dump(index,f,indent=2,sort_keys=True)
+    _dump(args.out, "INDEX.json", index)
 
     print(f"Wrote JSON pack to: {os.path.abspath(args.out)}")
 
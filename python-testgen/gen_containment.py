@@ -11,41 +11,47 @@ Key features:
   • Deterministic (no randomness)
   • RFC-driven canonical ranges plus boundary/sibling/parent sampling
   • More "False" net-containment cases without reducing "True" cases
+  • Writes JSON with orjson when installed (same bytes as the stdlib path)
+  • Pure stdlib otherwise, so it also runs unchanged (and faster) on PyPy
 
 Usage:
   python generate_large_cidr_fixtures.py --out ./fixtures --scale medium
+  pypy3 generate_large_cidr_fixtures.py --out ./fixtures --scale huge
 """
 
 from __future__ import annotations
 
 import argparse
-import datetime
+from concurrent.futures import ProcessPoolExecutor
+import functools
 import ipaddress as ip
-import itertools
-import json
 import os
-from typing import Iterable, List, Dict, Any
+from typing import List, Dict, Any, NamedTuple, Tuple
+
+from _fmt import FAST_JSON, GEN_AT, dumps_json, format_v4, format_v6
 
 
 # -----------------------------
 # Scale presets (tune safely)
 # -----------------------------
+# v4_children: (depth below the outer prefix, count) per child level, clamped to /32
+# v6_children: (absolute target prefix, count) per child level
 SCALES = {
     # conservative smoke
-    "tiny":   dict(addr_steps=12,  cross_per_net=4,  v4_child25=4,  v4_child26=8,  v4_child27=8,
-                   v6_child48=8,  v6_child64=8),
+    "tiny":   dict(addr_steps=12,  cross_per_net=4,  v4_children=((25, 4), (26, 8), (27, 8)),
+                   v6_children=((48, 8), (64, 8))),
     # small CI job
-    "small":  dict(addr_steps=24,  cross_per_net=6,  v4_child25=8,  v4_child26=12, v4_child27=16,
-                   v6_child48=16, v6_child64=16),
+    "small":  dict(addr_steps=24,  cross_per_net=6,  v4_children=((25, 8), (26, 12), (27, 16)),
+                   v6_children=((48, 16), (64, 16))),
     # default
-    "medium": dict(addr_steps=64,  cross_per_net=10, v4_child25=8,  v4_child26=16, v4_child27=16,
-                   v6_child48=64, v6_child64=64),
+    "medium": dict(addr_steps=64,  cross_per_net=10, v4_children=((25, 8), (26, 16), (27, 16)),
+                   v6_children=((48, 64), (64, 64))),
     # big but sane
-    "large":  dict(addr_steps=256, cross_per_net=24, v4_child25=32, v4_child26=64, v4_child27=128,
-                   v6_child48=256, v6_child64=512),
+    "large":  dict(addr_steps=256, cross_per_net=24, v4_children=((25, 32), (26, 64), (27, 128)),
+                   v6_children=((48, 256), (64, 512))),
     # aggressively big while bounded
-    "huge":   dict(addr_steps=512, cross_per_net=64, v4_child25=128, v4_child26=256, v4_child27=512,
-                   v6_child48=1024, v6_child64=2048),
+    "huge":   dict(addr_steps=512, cross_per_net=64, v4_children=((25, 128), (26, 256), (27, 512)),
+                   v6_children=((48, 1024), (64, 2048))),
 }
 
 
@@ -53,20 +59,82 @@ SCALES = {
 # Helpers
 # -----------------------------
 
-def take(iterable: Iterable[Any], n: int) -> List[Any]:
-    return list(itertools.islice(iterable, n))
-
-
-def write_json(path: str, obj: Any):
+# Cases are kept as compact rows and only turned into JSON objects while writing
+MembershipRow = Tuple[str, str, bool]       # (address, network, expect)
+ContainmentRow = Tuple[str, str, bool]      # (inner, outer, expect)
+MEMBERSHIP_FIELDS = ("address", "network", "expect")
+CONTAINMENT_FIELDS = ("inner", "outer", "expect")
+
+
+# Cases are written at a 4-space indent inside the document; every case has the same
+# keys, so they are put in sorted order once instead of having the encoder sort each one
+if FAST_JSON:
+    def case_encoder(fields: tuple[str, ...]):
+        keyed = sorted((name, i) for i, name in enumerate(fields))
+
+        def encode(row: tuple) -> bytes:
+            # JSON strings never contain a raw newline, so this only re-indents structure
+            case = {name: row[i] for name, i in keyed}
+            return b"    " + dumps_json(case).replace(b"\n", b"\n    ")
+        return encode
+else:
+    def case_encoder(fields: tuple[str, ...]):
+        # The pure-Python encoder is slow per object, so fill a pre-encoded case
+        # template instead; the same network strings (and true/false) recur on many
+        # rows, so each distinct value is encoded once. Row values must be JSON scalars.
+        keyed = sorted((name, i) for i, name in enumerate(fields))
+        order = [i for _, i in keyed]
+        template = b"    {\n" + b",\n".join(b"      " + dumps_json(name) + b": %b" for name, _ in keyed) + b"\n    }"
+        encoded: Dict[Any, bytes] = {}
+
+        def enc(v: Any) -> bytes:
+            try:
+                return encoded[v]
+            except KeyError:
+                b = encoded[v] = dumps_json(v)
+                return b
+
+        def encode(row: tuple) -> bytes:
+            return template % tuple([enc(row[i]) for i in order])
+        return encode
+
+
+def write_cases_json(path: str, meta: Dict[str, Any], fields: tuple[str, ...], cases: List[tuple]):
+    """
+    Writes {"cases": [{field: value, ...} per row], "meta": meta} exactly as
+    json.dump(indent=2, sort_keys=True) would, but encodes one case at a time so the
+    document is never held in memory whole.
+    """
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(obj, f, indent=2, sort_keys=True)
+    encode = case_encoder(fields)
+    with open(path, "wb") as f:
+        if cases:
+            f.write(b'{\n  "cases": [\n')
+            for n, row in enumerate(cases):
+                if n:
+                    f.write(b",\n")
+                f.write(encode(row))
+            f.write(b"\n  ],\n")
+        else:
+            f.write(b'{\n  "cases": [],\n')
+        f.write(b'  "meta": ' + dumps_json(meta, sort_keys=True).replace(b"\n", b"\n  ") + b"\n}")
+
+
+# Addresses per block at each prefix length, indexed [version][prefixlen]
+BLOCK_SIZE = {
+    4: [1 << (32 - p) for p in range(33)],
+    6: [1 << (128 - p) for p in range(129)],
+}
 
 
+# Parsers are memoized: the canonical lists are parsed by both assemblers and the
+# same address strings recur across sampled networks
+@functools.lru_cache(maxsize=None)
 def addr(a: str) -> ip._BaseAddress:
     return ip.ip_address(a)
 
 
+@functools.lru_cache(maxsize=None)
 def net(n: str, strict: bool = True) -> ip._BaseNetwork:
     return ip.ip_network(n, strict=strict)
 
@@ -163,90 +231,108 @@ def more_ipv6_addresses() -> List[str]:
 # Sampling & bounded enumeration
 # -----------------------------
 
-def derive_boundary_addresses(n: ip._BaseNetwork) -> List[str]:
+def boundary_ints(n: ip._BaseNetwork) -> set[int]:
     out = set()
     lo = int(n.network_address)
     hi = int(getattr(n, "broadcast_address", n.network_address))  # IPv6 has no broadcast in lib, but equal for range
     fam_bits = 32 if n.version == 4 else 128
     minv, maxv = 0, (1 << fam_bits) - 1
 
-    out.add(str(n.network_address))
+    out.add(lo)
     if n.version == 4:
-        out.add(str(n.broadcast_address))
+        out.add(hi)
         if n.prefixlen <= 30 and n.num_addresses >= 4:
-            out.add(str(ip.ip_address(lo + 1)))
-            out.add(str(ip.ip_address(hi - 1)))
+            out.add(lo + 1)
+            out.add(hi - 1)
     else:
         # For IPv6, synthesize "hi" as last address of the range
-        last = int(n.network_address) + (n.num_addresses - 1)
-        out.add(str(ip.ip_address(last)))
+        last = lo + (n.num_addresses - 1)
+        out.add(last)
         # Pick neighbors if in range
         if n.num_addresses >= 4:
-            out.add(str(ip.ip_address(int(n.network_address) + 1)))
-            out.add(str(ip.ip_address(last - 1)))
+            out.add(lo + 1)
+            out.add(last - 1)
 
     if lo - 1 >= minv:
-        out.add(str(ip.ip_address(lo - 1)))
+        out.add(lo - 1)
     if hi + 1 <= maxv:
-        out.add(str(ip.ip_address(hi + 1)))
-    return sorted(out)
+        out.add(hi + 1)
+    return out
 
 
-def sample_addresses_for_network(n: ip._BaseNetwork, addr_steps_cap: int) -> List[str]:
+def sample_address_ints(n: ip._BaseNetwork, addr_steps_cap: int) -> set[int]:
     # Combine boundary sampling with coarse stepping through the space
-    out = list(derive_boundary_addresses(n))
-    if addr_steps_cap <= 0:
-        return sorted(set(out))
+    out = boundary_ints(n)
 
     # step over host-space in a deterministic way
     total = n.num_addresses
     steps = min(addr_steps_cap, max(0, total - 1))
     if steps > 0:
-        stride = max(1, total // steps)
+        # steps < total, so stride >= 1 and (steps - 1) * stride < total: every
+        # sample stays inside the network without clamping each step
+        stride = total // steps
         base = int(n.network_address)
-        for k in range(steps):
-            a = base + min(total - 1, k * stride)
-            out.append(str(ip.ip_address(a)))
-    return sorted(set(out))
+        out.update(range(base, base + steps * stride, stride))
+    return out
+
+
+def sample_addresses_for_network(n: ip._BaseNetwork, addr_steps_cap: int) -> List[Tuple[str, int]]:
+    """
+    Sampled addresses for n as (text, int) pairs, sorted by text. Dedup happens on the
+    integers and each address is formatted once; callers test membership on the int.
+    """
+    fmt = format_v4 if n.version == 4 else format_v6
+    return sorted((fmt(a), a) for a in sample_address_ints(n, addr_steps_cap))
 
 
 # -----------------------------
 # Net-containment extra False-case builders
 # -----------------------------
 
-def sibling_of(n: ip._BaseNetwork) -> ip._BaseNetwork | None:
+def bounded_children(n: ip._BaseNetwork, new_prefix: int, max_children: int) -> list[ip._BaseNetwork]:
+    """
+    Returns the first max_children subnets of n at new_prefix, or [] if new_prefix is not
+    longer than n.prefixlen or exceeds the family max (/32 for IPv4, /128 for IPv6).
+    Children are laid out arithmetically instead of walking n.subnets().
+    """
+    maxp = n.max_prefixlen
+    if new_prefix <= n.prefixlen or new_prefix > maxp:
+        return []
+    cls = type(n)
+    base = int(n.network_address)
+    step = BLOCK_SIZE[n.version][new_prefix]
+    count = min(max_children, 1 << (new_prefix - n.prefixlen))
+    return [cls((base + i * step, new_prefix)) for i in range(count)]
+
+
+def bounded_child_strs(n: ip._BaseNetwork, new_prefix: int, max_children: int) -> list[str]:
     """
-    Returns a sibling network with the same prefix length as n, if it exists.
+    Same children as bounded_children(), as CIDR text formatted straight from the
+    integers, for callers that never need the network objects.
     """
-    try:
-        parent = n.supernet()
-    except ValueError:
-        return None
-    subs = list(parent.subnets(new_prefix=n.prefixlen))
-    if len(subs) < 2:
-        return None
-    return subs[1] if subs[0] == n else subs[0]
+    maxp = n.max_prefixlen
+    if new_prefix <= n.prefixlen or new_prefix > maxp:
+        return []
+    fmt = format_v4 if n.version == 4 else format_v6
+    suffix = f"/{new_prefix}"
+    base = int(n.network_address)
+    step = BLOCK_SIZE[n.version][new_prefix]
+    count = min(max_children, 1 << (new_prefix - n.prefixlen))
+    return [fmt(base + i * step) + suffix for i in range(count)]
 
 
 def bounded_child(n: ip._BaseNetwork, new_prefix: int) -> ip._BaseNetwork | None:
     """
     Returns the first child at new_prefix if it is longer than n.prefixlen, else None.
     """
-    if new_prefix <= n.prefixlen:
-        return None
-    # Guard against exceeding family max (/32 for IPv4, /128 for IPv6)
-    maxp = getattr(n, "max_prefixlen", 32 if n.version == 4 else 128)
-    if new_prefix > maxp:
-        return None
-    try:
-        return next(n.subnets(new_prefix=new_prefix))
-    except (StopIteration, ValueError):
-        # ValueError can happen if new_prefix is invalid for this netblock
-        return None
+    children = bounded_children(n, new_prefix, 1)
+    return children[0] if children else None
 
 
-
-def expand_false_pairs_for_outer(outer: ip._BaseNetwork, budget: int) -> list[dict[str, object]]:
+# Both pair builders are pure in their arguments, so results are memoized (as tuples,
+# safe to share) for callers that assemble the same scale more than once in-process
+@functools.lru_cache(maxsize=None)
+def expand_false_pairs_for_outer(outer: ip._BaseNetwork, budget: int) -> Tuple[ContainmentRow, ...]:
     """
     Produce multiple not-contained cases for a given outer, within a deterministic budget.
     Strategies (in order, until budget is exhausted):
@@ -255,167 +341,149 @@ def expand_false_pairs_for_outer(outer: ip._BaseNetwork, budget: int) -> list[di
       3) Sibling's child: inner = first-child(sibling, outer.prefixlen+1), expect False
       4) Wider parent ladders: move up more parent levels
       5) Additional sibling children with deeper prefixes for variety
+    Ancestors and sibling are derived by masking the network address, and only the
+    CIDR text that goes into the output is ever formatted.
     """
-    out: list[dict[str, object]] = []
-    remaining = budget
-
-    # 1) Parent vs child (shorter prefix cannot be contained in the more specific outer)
-    try:
-        parent = outer.supernet()
-    except ValueError:
-        parent = None
-    if parent and remaining > 0:
-        out.append(dict(inner=str(parent), outer=str(outer), expect=False))
-        remaining -= 1
-
-    # 2) Sibling at same prefix (disjoint)
-    sib = sibling_of(outer)
-    if sib and remaining > 0:
-        out.append(dict(inner=str(sib), outer=str(outer), expect=False))
-        remaining -= 1
-
-    # 3) A subnet of the sibling (also disjoint)
-    if sib and remaining > 0:
-        sib_child = bounded_child(sib, outer.prefixlen + 1)
-        if sib_child:
-            out.append(dict(inner=str(sib_child), outer=str(outer), expect=False))
-            remaining -= 1
-
-    # 4) Walk further up the ladder a bit
-    up = parent
-    steps = 0
-    while up and remaining > 0 and steps < 2:
-        try:
-            up2 = up.supernet()
-        except ValueError:
-            up2 = None
-        if up2:
-            out.append(dict(inner=str(up2), outer=str(outer), expect=False))
-            remaining -= 1
-        up = up2
-        steps += 1
-
-    # 5) If budget remains, make deeper sibling children
-    if sib and remaining > 0:
-        maxp = getattr(outer, "max_prefixlen", 32 if outer.version == 4 else 128)
-        depth = 2
-        while remaining > 0 and depth <= 4 and (outer.prefixlen + depth) <= maxp:
-            sib_deeper = bounded_child(sib, outer.prefixlen + depth)
-            if sib_deeper:
-                out.append(dict(inner=str(sib_deeper), outer=str(outer), expect=False))
-                remaining -= 1
-            depth += 1
-
-    return out
-
+    plen = outer.prefixlen
+    if plen == 0 or budget <= 0:
+        # /0 has neither a parent nor a sibling, and every strategy starts from one
+        return ()
+    maxp = outer.max_prefixlen
+    fmt = format_v4 if outer.version == 4 else format_v6
+    sizes = BLOCK_SIZE[outer.version]
+    lo = int(outer.network_address)
+
+    # Candidates are (network int, prefix) in strategy order; only the ones the
+    # budget keeps get formatted. The sibling differs from outer only in the last
+    # prefix bit, and its children at deeper prefixes all start at its own address.
+    sib = lo ^ sizes[plen]
+    inners = [(lo & -sizes[plen - 1], plen - 1), (sib, plen)]                 # 1), 2)
+    if plen + 1 <= maxp:
+        inners.append((sib, plen + 1))                                          # 3)
+    # (supernet() stops at /0 and keeps returning it, so the ladder does too)
+    for p in (max(plen - 2, 0), max(plen - 3, 0)):
+        inners.append((lo & -sizes[p], p))                                      # 4)
+    inners.extend((sib, plen + d) for d in (2, 3, 4) if plen + d <= maxp)      # 5)
+
+    outer_str = str(outer)
+    return tuple((f"{fmt(a)}/{p}", outer_str, False) for a, p in inners[:budget])
 
 
 # -----------------------------
 # Case assembly
 # -----------------------------
 
-def assemble_addr_membership_cases(scale: str) -> list[dict[str, object]]:
+def net_bounds(n: ip._BaseNetwork) -> tuple[int, int]:
+    """First and last address of n as ints; membership is then two integer compares."""
+    return int(n.network_address), int(n.broadcast_address)
+
+
+# Both assemblers start from the same canonical lists; parse them (and take their
+# text and bounds) once per family and scale
+@functools.lru_cache(maxsize=None)
+def _canonical_nets(version: int, scale: str) -> Tuple[ip._BaseNetwork, ...]:
+    names = ipv4_canonical_networks(scale) if version == 4 else ipv6_canonical_networks(scale)
+    return tuple(net(n) for n in names)
+
+
+class NetRec(NamedTuple):
+    """A canonical network with its text and integer bounds taken once."""
+    net: ip._BaseNetwork
+    text: str
+    lo: int
+    hi: int
+
+
+@functools.lru_cache(maxsize=None)
+def _canonical_recs(version: int, scale: str) -> Tuple[NetRec, ...]:
+    return tuple(NetRec(n, str(n), *net_bounds(n)) for n in _canonical_nets(version, scale))
+
+
+def assemble_addr_membership_cases(scale: str) -> list[MembershipRow]:
     params = SCALES[scale]
     addr_steps = int(params.get("addr_steps", 64))
 
-    v4_nets = [net(n) for n in ipv4_canonical_networks(scale)]
-    v6_nets = [net(n) for n in ipv6_canonical_networks(scale)]
+    v4_recs = _canonical_recs(4, scale)
+    v6_recs = _canonical_recs(6, scale)
 
-    cases: list[dict[str, object]] = []
+    cases: list[MembershipRow] = []
 
     # IPv4: sample addresses per network
-    for n4 in v4_nets:
-        for a in sample_addresses_for_network(n4, addr_steps):
-            a4 = addr(a)
-            expect = a4 in n4
-            cases.append(dict(address=str(a4), network=str(n4), expect=bool(expect)))
+    for n4, n_str, lo, hi in v4_recs:
+        cases.extend([(a_str, n_str, lo <= ai <= hi)
+                      for a_str, ai in sample_addresses_for_network(n4, addr_steps)])
 
     # Add more IPv4 addresses against multiple nets
-    for a in more_ipv4_addresses():
-        a4 = addr(a)
-        # Test against all canonical v4 nets (bounded by scale through size of canonical list)
-        for n4 in v4_nets:
-            cases.append(dict(address=str(a4), network=str(n4), expect=bool(a4 in n4)))
+    # (bounded by scale through size of canonical list)
+    extras = [(str(a4), int(a4)) for a4 in map(addr, more_ipv4_addresses())]
+    cases.extend([(a_str, n_str, lo <= ai <= hi)
+                  for a_str, ai in extras for _, n_str, lo, hi in v4_recs])
 
     # IPv6: sample addresses per network
-    for n6 in v6_nets:
-        for a in sample_addresses_for_network(n6, addr_steps):
-            a6 = addr(a)
-            expect = a6 in n6
-            cases.append(dict(address=str(a6), network=str(n6), expect=bool(expect)))
+    for n6, n_str, lo, hi in v6_recs:
+        cases.extend([(a_str, n_str, lo <= ai <= hi)
+                      for a_str, ai in sample_addresses_for_network(n6, addr_steps)])
 
     # Add more IPv6 addresses against multiple nets
-    for a in more_ipv6_addresses():
-        a6 = addr(a)
-        for n6 in v6_nets:
-            cases.append(dict(address=str(a6), network=str(n6), expect=bool(a6 in n6)))
+    extras = [(str(a6), int(a6)) for a6 in map(addr, more_ipv6_addresses())]
+    cases.extend([(a_str, n_str, lo <= ai <= hi)
+                  for a_str, ai in extras for _, n_str, lo, hi in v6_recs])
 
     return cases
 
 
-def true_net_containment_pairs_for_outer(outer: ip._BaseNetwork, params: Dict[str, Any]) -> list[dict[str, object]]:
+def true_net_containment_pairs_for_outer(outer: ip._BaseNetwork, params: Dict[str, Any]) -> Tuple[ContainmentRow, ...]:
     """
     Build 'True' containment cases for a given outer network:
       - identical network
       - a few children at selected deeper prefixes
       - ladder of descendants
     """
-    out: list[dict[str, object]] = []
+    return _true_pairs(outer, tuple(sorted(params.items())))
+
+
+@functools.lru_cache(maxsize=None)
+def _true_pairs(outer: ip._BaseNetwork, params_key: Tuple[Tuple[str, Any], ...]) -> Tuple[ContainmentRow, ...]:
+    params = dict(params_key)
+    out: list[ContainmentRow] = []
+    outer_str = str(outer)
 
     # identical
-    out.append(dict(inner=str(outer), outer=str(outer), expect=True))
+    out.append((outer_str, outer_str, True))
 
-    # children at specific depths depending on family and scale knobs
+    # children at specific depths depending on family and scale knobs, as
+    # (target_prefix, count) specs walked in one loop
     if outer.version == 4:
-        for dp_key in ("v4_child25", "v4_child26", "v4_child27"):
-            new_prefix_count = params.get(dp_key, 0)
-            target_prefix = min(32, max(0, int(outer.prefixlen) + int(dp_key.split("_child")[-1])))
-            if target_prefix <= 32 and target_prefix > outer.prefixlen and new_prefix_count > 0:
-                # take a bounded number of children at target_prefix
-                try:
-                    children = take(outer.subnets(new_prefix=target_prefix), min(new_prefix_count, 8))
-                    for ch in children:
-                        out.append(dict(inner=str(ch), outer=str(outer), expect=True))
-                except ValueError:
-                    pass
+        children = [(min(32, outer.prefixlen + depth), count) for depth, count in params.get("v4_children", ())]
+        cap = 8
     else:
-        # IPv6 knobs
-        targets = [(48, "v6_child48"), (64, "v6_child64")]
-        for target, key in targets:
-            if outer.prefixlen < target:
-                count = params.get(key, 0)
-                if count > 0:
-                    try:
-                        children = take(outer.subnets(new_prefix=target), min(count, 32))
-                        for ch in children:
-                            out.append(dict(inner=str(ch), outer=str(outer), expect=True))
-                    except ValueError:
-                        pass
+        children = params.get("v6_children", ())
+        cap = 32
+    for target_prefix, count in children:
+        # nothing comes back unless target_prefix is deeper than outer and count > 0
+        for ch in bounded_child_strs(outer, target_prefix, min(count, cap)):
+            out.append((ch, outer_str, True))
 
     # descendant ladder: go deeper a few steps if possible
     cursor = outer
     steps = 0
     while steps < 3 and cursor.prefixlen < (32 if outer.version == 4 else 128):
-        newp = cursor.prefixlen + 1
-        try:
-            nxt = next(cursor.subnets(new_prefix=newp))
-        except StopIteration:
-            break
-        out.append(dict(inner=str(nxt), outer=str(outer), expect=True))
+        nxt = bounded_child(cursor, cursor.prefixlen + 1)
+        out.append((str(nxt), outer_str, True))
         cursor = nxt
         steps += 1
 
-    return out
+    return tuple(out)
 
 
-def assemble_net_containment_cases(scale: str) -> list[dict[str, object]]:
+def assemble_net_containment_cases(scale: str) -> list[ContainmentRow]:
     params = SCALES[scale]
     cross_budget = int(params.get("cross_per_net", 6))
 
-    v4_nets = [net(n) for n in ipv4_canonical_networks(scale)]
-    v6_nets = [net(n) for n in ipv6_canonical_networks(scale)]
+    v4_nets = _canonical_nets(4, scale)
+    v6_nets = _canonical_nets(6, scale)
 
-    cases: list[dict[str, object]] = []
+    cases: list[ContainmentRow] = []
 
     # TRUE cases first (kept intact)
     for n4 in v4_nets:
@@ -439,28 +507,43 @@ def assemble_net_containment_cases(scale: str) -> list[dict[str, object]]:
 # CLI and main
 # -----------------------------
 
+def write_fixture(path: str, assemble, fields: tuple[str, ...], scale: str, meta: Dict[str, Any]) -> None:
+    # Assemble and write in the same process, so worker results never travel back
+    write_cases_json(path, meta, fields, assemble(scale))
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate scalable CIDR fixtures")
     parser.add_argument("--out", default="../cidre/src/jvmTest/resources/pythontest", help="Output directory for JSON fixtures")
     parser.add_argument("--scale", choices=list(SCALES.keys()), default="medium", help="Fixture size preset")
     parser.add_argument("--no-membership", action="store_true", help="Skip addr_membership.json")
     parser.add_argument("--no-containment", action="store_true", help="Skip net_containment.json")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Worker processes for the two fixtures (1 = in-process, 0 = one per CPU)")
     args = parser.parse_args()
 
-    ts = datetime.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    # Passed to the workers, so both fixtures carry the parent's timestamp
     meta = {
-        "generated": ts,
+        "generated": GEN_AT,
         "notes": args.scale,
         "version": "0.2"
     }
 
+    fixtures = []
     if not args.no_membership:
-        addr_cases = assemble_addr_membership_cases(args.scale)
-        write_json(os.path.join(args.out, "addr_membership.json"), {"meta": meta, "cases": addr_cases})
-
+        fixtures.append(("addr_membership.json", assemble_addr_membership_cases, MEMBERSHIP_FIELDS))
     if not args.no_containment:
-        net_cases = assemble_net_containment_cases(args.scale)
-        write_json(os.path.join(args.out, "net_containment.json"), {"meta": meta, "cases": net_cases})
+        fixtures.append(("net_containment.json", assemble_net_containment_cases, CONTAINMENT_FIELDS))
+
+    if args.jobs == 1 or len(fixtures) < 2:
+        for name, assemble, fields in fixtures:
+            write_fixture(os.path.join(args.out, name), assemble, fields, args.scale, meta)
+    else:
+        with ProcessPoolExecutor(max_workers=min(args.jobs or len(fixtures), len(fixtures))) as ex:
+            futures = [ex.submit(write_fixture, os.path.join(args.out, name), assemble, fields, args.scale, meta)
+                       for name, assemble, fields in fixtures]
+            for fut in futures:
+                fut.result()
 
     print(f"[OK] Wrote fixtures to: {args.out} (scale={args.scale})")
 
@@ -1,21 +1,19 @@
 import argparse
 import ipaddress
-import json
 import random
 from typing import Any, Dict, List, Optional, Tuple
 
+from _fmt import write_json
+
 
 def as_net(cidr: str):
     return ipaddress.ip_network(cidr, strict=True)
 
 
-def collapse_pair(a, b):
-    # Returns list from ipaddress.collapse_addresses
-    return list(ipaddress.collapse_addresses([a, b]))
-
-
 def mergeable_and_supernet(a, b) -> Tuple[bool, Optional[ipaddress._BaseNetwork], Optional[str]]:
-    # Use stdlib collapse + subnets to determine mergeability (no custom predicate).
+    # Two same-length networks merge exactly when they are the two halves of one
+    # parent: their network addresses differ only in the last prefix bit. This is
+    # what collapse_addresses + subnets would conclude, without building either.
     if a.version != b.version:
         return False, None, "different families"
     if a.prefixlen != b.prefixlen:
@@ -23,23 +21,16 @@ def mergeable_and_supernet(a, b) -> Tuple[bool, Optional[ipaddress._BaseNetwork]
     if a.prefixlen == 0:
         return False, None, "cannot supernet /0"
 
-    collapsed = collapse_pair(a, b)
-    if len(collapsed) != 1:
-        return False, None, "does not collapse to single supernet"
-    sup = collapsed[0]
-    if sup.prefixlen != a.prefixlen - 1:
+    na = int(a.network_address)
+    nb = int(b.network_address)
+    if na == nb:
+        # collapses to the network itself
         return False, None, "collapsed supernet is not one bit shorter"
+    bit = 1 << (a.max_prefixlen - a.prefixlen)
+    if na ^ nb != bit:
+        return False, None, "does not collapse to single supernet"
 
-    # Check that sup’s subnets at the original prefix split exactly into {a, b}
-    parts = list(sup.subnets(new_prefix=a.prefixlen))
-    if len(parts) != 2:
-        return False, None, "unexpected subdivision count"
-    expect_set = {n.with_prefixlen for n in parts}
-    got_set = {a.with_prefixlen, b.with_prefixlen}
-    if expect_set != got_set:
-        return False, None, "collapsed supernet does not split back into the two inputs"
-
-    return True, sup, None
+    return True, type(a)((na & ~bit, a.prefixlen - 1)), None
 
 
 def make_case(a, b, note: Optional[str] = None) -> Dict[str, Any]:
@@ -91,30 +82,40 @@ def edge_cases() -> List[Dict[str, Any]]:
     return cases
 
 
+# Prefix pools the random builders draw from (tuples, built once)
+_V4_PREFIXES = (31, 30, 29, 28, 27, 26, 25, 24)  # focus where merges are common
+_V6_PREFIXES = (66, 65, 64, 63)                  # focus near /64
+_V6_CHILD_PREFIXES = (66, 65, 64)                # mergeable children: parent between /65 and /63
+
+
 def random_ipv4_prefix() -> int:
-    # Focus where merges are common
-    return random.choice([31, 30, 29, 28, 27, 26, 25, 24])
+    return random.choice(_V4_PREFIXES)
 
 
 def random_ipv6_prefix() -> int:
-    # Focus near /64
-    return random.choice([66, 65, 64, 63])
+    return random.choice(_V6_PREFIXES)
+
+
+# Random networks are drawn from these ranges; keep their bounds as ints so each
+# draw does not re-parse the base network
+_V4_BASE = ipaddress.IPv4Network("10.0.0.0/16")
+_V4_LO, _V4_END = int(_V4_BASE.network_address), int(_V4_BASE.broadcast_address) + 1
+_V6_BASE = ipaddress.IPv6Network("2001:db8::/32")
+_V6_LO, _V6_END = int(_V6_BASE.network_address), int(_V6_BASE.broadcast_address) + 1
 
 
 def random_ipv4_network(prefix: int) -> ipaddress.IPv4Network:
     # Keep in 10.0.0.0/16 area to constrain randomness
-    base = ipaddress.IPv4Network("10.0.0.0/16")
     # choose an aligned start
     size = 1 << (32 - prefix)
-    start = random.randrange(int(base.network_address), int(base.broadcast_address) + 1 - size, size)
+    start = random.randrange(_V4_LO, _V4_END - size, size)
     return ipaddress.IPv4Network((start, prefix), strict=True)
 
 
 def random_ipv6_network(prefix: int) -> ipaddress.IPv6Network:
-    base = ipaddress.IPv6Network("2001:db8::/32")
     size = 1 << (128 - prefix)
     # keep within a modest range in that /32
-    start = random.randrange(int(base.network_address), int(base.broadcast_address) + 1 - size, size)
+    start = random.randrange(_V6_LO, _V6_END - size, size)
     return ipaddress.IPv6Network((start, prefix), strict=True)
 
 
@@ -135,104 +136,98 @@ def make_adjacent_of_same_prefix(net):
         return net
 
 
+def first_subnet(net, new_prefix: int):
+    # Same as next(net.subnets(new_prefix=...)): the child starts at the parent's address
+    return type(net)((int(net.network_address), new_prefix))
+
+
+def halves(net):
+    # The two children one bit longer than net, laid out arithmetically
+    child_prefix = net.prefixlen + 1
+    base = int(net.network_address)
+    half = 1 << (net.max_prefixlen - child_prefix)
+    cls = type(net)
+    return cls((base, child_prefix)), cls((base + half, child_prefix))
+
+
+# Per family: address width, network class, and the random prefix/network samplers
+_FAMILIES = {
+    4: (32, ipaddress.IPv4Network, random_ipv4_prefix, random_ipv4_network),
+    6: (128, ipaddress.IPv6Network, random_ipv6_prefix, random_ipv6_network),
+}
+# Child prefixes for mergeable pairs: parents between /23 and /30 for IPv4, between
+# /63 and /65 for IPv6
+_MERGEABLE_CHILD_PREFIXES = {4: _V4_PREFIXES, 6: _V6_CHILD_PREFIXES}
+
+
 def random_mergeable_pair(version: int):
     # Build a supernet S, then pick its two subnets ⇒ guaranteed mergeable siblings
-    if version == 4:
-        # pick a parent prefix between /23 and /31 so children are between /24 and /32
-        child_prefix = random.choice([31, 30, 29, 28, 27, 26, 25, 24])
-        parent_prefix = child_prefix - 1
-        parent = random_ipv4_network(parent_prefix)
-        subs = list(parent.subnets(new_prefix=child_prefix))
-        a, b = subs[0], subs[1]
-        return a, b
-    else:
-        child_prefix = random.choice([66, 65, 64])  # parent between /65 and /63
-        parent_prefix = child_prefix - 1
-        parent = random_ipv6_network(parent_prefix)
-        subs = list(parent.subnets(new_prefix=child_prefix))
-        a, b = subs[0], subs[1]
-        return a, b
+    random_network = _FAMILIES[version][3]
+    child_prefix = random.choice(_MERGEABLE_CHILD_PREFIXES[version])
+    parent = random_network(child_prefix - 1)
+    return halves(parent)
+
+
+_NONMERGEABLE_KINDS = ("adjacent_diff_prefix", "containment", "disjoint", "adjacent_misaligned")
 
 
 def random_nonmergeable_pair(version: int):
     # Produce a variety of non-mergeable situations (std lib will verify)
-    if version == 4:
-        p = random_ipv4_prefix()
-        a = random_ipv4_network(p)
-        kind = random.choice(["adjacent_diff_prefix", "containment", "disjoint", "adjacent_misaligned"])
-        if kind == "adjacent_diff_prefix":
-            b = ipaddress.ip_network((int(a.broadcast_address) + 1, max(0, p - 1)), strict=False)
-            return a, b
-        elif kind == "containment":
-            # pick a stricter subnet inside a
-            sub_p = min(32, p + 1)
-            b = list(a.subnets(new_prefix=sub_p))[0]
-            return a, b
-        elif kind == "adjacent_misaligned":
-            # make neighbor of same prefix, but ensure they are not siblings under a /p-1 parent
+    width, net_cls, random_prefix, random_network = _FAMILIES[version]
+    p = random_prefix()
+    a = random_network(p)
+    kind = random.choice(_NONMERGEABLE_KINDS)
+    if kind == "adjacent_diff_prefix":
+        b = net_cls((int(a.broadcast_address) + 1, max(0, p - 1)), strict=False)
+        return a, b
+    elif kind == "containment":
+        # pick a stricter subnet inside a
+        sub_p = min(width, p + 1)
+        b = first_subnet(a, sub_p)
+        return a, b
+    elif kind == "adjacent_misaligned":
+        # make neighbor of same prefix, but ensure they are not siblings under a /p-1 parent
+        neighbor = make_adjacent_of_same_prefix(a)
+        # If siblings (they would collapse into a /p-1), shift a by one block to break
+        # alignment; same-length siblings differ exactly in the block-size bit
+        size = 1 << (width - a.prefixlen)
+        a_lo = int(a.network_address)
+        if a.prefixlen > 0 and a_lo ^ int(neighbor.network_address) == size:
+            # Move one block of size 2^(width-p)
+            a = net_cls((a_lo + size, a.prefixlen), strict=True)
             neighbor = make_adjacent_of_same_prefix(a)
-            # If siblings, shift a by one block to break alignment
-            parent = list(ipaddress.collapse_addresses([a, neighbor]))[0] if a.prefixlen > 0 else a
-            if parent.prefixlen == a.prefixlen - 1:
-                # Move one block
-                size = (1 << (32 - a.prefixlen))
-                a = ipaddress.IPv4Network((int(a.network_address) + size, a.prefixlen), strict=True)
-                neighbor = make_adjacent_of_same_prefix(a)
-            return a, neighbor
-        else:
-            # disjoint: pick another random net and retry a few times until not adjacent/overlapping
-            tries = 0
-            while True:
-                b = random_ipv4_network(p)
-                if not a.overlaps(b):
-                    collapsed = list(ipaddress.collapse_addresses([a, b]))
-                    if len(collapsed) != 1:  # not collapsing to one ⇒ not mergeable nor containment
-                        return a, b
-                tries += 1
-                if tries > 10:
-                    return a, b
+        return a, neighbor
     else:
-        p = random_ipv6_prefix()
-        a = random_ipv6_network(p)
-        kind = random.choice(["adjacent_diff_prefix", "containment", "disjoint", "adjacent_misaligned"])
-        if kind == "adjacent_diff_prefix":
-            b = ipaddress.ip_network((int(a.broadcast_address) + 1, max(0, p - 1)), strict=False)
-            return a, b
-        elif kind == "containment":
-            sub_p = min(128, p + 1)
-            b = list(a.subnets(new_prefix=sub_p))[0]
-            return a, b
-        elif kind == "adjacent_misaligned":
-            neighbor = make_adjacent_of_same_prefix(a)
-            parent = list(ipaddress.collapse_addresses([a, neighbor]))[0] if a.prefixlen > 0 else a
-            if parent.prefixlen == a.prefixlen - 1:
-                # shift one block of size 2^(128-p)
-                size = 1 << (128 - a.prefixlen)
-                a = ipaddress.IPv6Network((int(a.network_address) + size, a.prefixlen), strict=True)
-                neighbor = make_adjacent_of_same_prefix(a)
-            return a, neighbor
-        else:
-            tries = 0
-            while True:
-                b = random_ipv6_network(p)
-                if not a.overlaps(b):
-                    collapsed = list(ipaddress.collapse_addresses([a, b]))
-                    if len(collapsed) != 1:
-                        return a, b
-                tries += 1
-                if tries > 10:
+        # disjoint: pick another random net and retry a few times until not adjacent/overlapping
+        # (same as "not a.overlaps(b) and collapse_addresses([a, b]) gives two networks")
+        size = 1 << (width - p)
+        a_lo = int(a.network_address)
+        a_hi = a_lo + size - 1
+        tries = 0
+        while True:
+            b = random_network(p)
+            b_lo = int(b.network_address)
+            if a_hi < b_lo or b_lo + size - 1 < a_lo:
+                if a_lo ^ b_lo != size:  # not siblings ⇒ not mergeable nor containment
                     return a, b
+            tries += 1
+            if tries > 10:
+                return a, b
+
+
+_VERSIONS = (4, 6)
+_KINDS = ("mergeable", "nonmergeable")
+# slightly more negatives to broaden coverage: weights 3:5, given cumulatively so
+# choices() does not re-accumulate them on every draw (the stream is the same)
+_KIND_CUM_WEIGHTS = (3, 8)
 
 
 def random_cases(count: int) -> List[Dict[str, Any]]:
     cases: List[Dict[str, Any]] = []
+    choice, choices = random.choice, random.choices
     for _ in range(count):
-        version = random.choice([4, 6])
-        kind = random.choices(
-            population=["mergeable", "nonmergeable"],
-            weights=[3, 5],  # slightly more negatives to broaden coverage
-            k=1
-        )[0]
+        version = choice(_VERSIONS)
+        kind = choices(_KINDS, cum_weights=_KIND_CUM_WEIGHTS)[0]
 
         if kind == "mergeable":
             a, b = random_mergeable_pair(version)
@@ -243,12 +238,12 @@ def random_cases(count: int) -> List[Dict[str, Any]]:
     return cases
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(description="Generate merge test cases using Python stdlib ipaddress.")
     parser.add_argument("--out", type=str, default="../cidre/src/jvmTest/resources/pythontest/merge_cases.json", help="Output JSON file path")
     parser.add_argument("--seed", type=int, default=1337, help="Random seed")
     parser.add_argument("--random-count", type=int, default=200, help="Number of random cases to generate")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     random.seed(args.seed)
 
@@ -256,8 +251,7 @@ def main():
     data.extend(edge_cases())
     data.extend(random_cases(args.random_count))
 
-    with open(args.out, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    write_json(args.out, data)
     print(f"Wrote {len(data)} cases to {args.out}")
 
 
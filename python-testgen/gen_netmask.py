@@ -3,9 +3,8 @@
 # Requires: pip install netaddr
 
 import argparse
-import json
-from datetime import datetime
-import ipaddress as ip
+
+from _fmt import GEN_AT, write_json
 
 def build_cases():
     cases = []
@@ -16,12 +15,12 @@ def build_cases():
     ]
 
     for version, octets, max_prefix, base in variants:
+        all_ones = (1 << max_prefix) - 1
         for p in range(0, max_prefix + 1):
-            n = ip.ip_network(f"{base}/{p}", strict=True)
-            mask = n.netmask
-            packed = mask.packed  # bytes
-            if len(packed) != octets:
-                raise RuntimeError(f"Unexpected netmask length for {version}/{p}: {len(packed)} vs {octets}")
+            # p leading one bits: the same value ip_network(f"{base}/{p}").netmask holds
+            mask = all_ones ^ (all_ones >> p)
+            packed = mask.to_bytes(octets, "big")
+            assert len(packed) == octets
             cases.append({
                 "version": version,           # "V4" or "V6"
                 "prefix": p,                  # integer prefix length
@@ -31,26 +30,21 @@ def build_cases():
     return cases
 
 
-def main():
+def main(argv=None):
     ap = argparse.ArgumentParser(description="Generate prefix->netmask cases using netaddr")
     ap.add_argument("-o", "--output", default="../cidre/src/jvmTest/resources/pythontest/netmask.json", help="Output JSON file (default: ../cidre/src/jvmTest/resources/pythontest/netmask.json)")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     payload = {
         "meta": {
             "tool": "gen_netmasks_netaddr.py",
-            "generated": datetime.utcnow().isoformat() + "Z",
+            "generated": GEN_AT,
             "source": "netaddr",
         },
         "cases": build_cases()
     }
 
-    text = json.dumps(payload, indent=2)
-    if args.output == "-" or not args.output:
-        print(text)
-    else:
-        with open(args.output, "w", encoding="utf-8") as f:
-            f.write(text)
+    write_json(args.output or "-", payload)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
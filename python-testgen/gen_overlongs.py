@@ -1,19 +1,26 @@
 #!/usr/bin/env python3
-import json, random
-from datetime import datetime
+import argparse, json, random
+from functools import lru_cache
+
+from _fmt import FAST_JSON, GEN_AT, write_json
 
 SEED = 20250911
-random.seed(SEED)
+# One private generator seeded like the former random.seed(SEED): the same stream,
+# with its bound methods looked up once for the draw loops below
+rng = random.Random(SEED)
+_random, _getrandbits, _choice = rng.random, rng.getrandbits, rng.choice
 
 MAX_128 = (1 << 128) - 1
 MAX_129 = (1 << 129) - 1
 TWO_POW_128 = 1 << 128
 
+# Operands are mostly the few edge values below, so most encodings are repeats
+@lru_cache(maxsize=None)
 def encode_overlong_hex(n: int) -> str:
     if n < 0 or n > MAX_129:
         raise ValueError("n out of range (0..2^129-1)")
-    length = 16 if n < TWO_POW_128 else 17
-    return n.to_bytes(length, "big").hex()
+    # Zero-padded hex of the 16- or 17-byte big-endian encoding, straight from the int
+    return format(n, "032x" if n < TWO_POW_128 else "034x")
 
 def op_inv(a: int) -> int:  return (~a) & MAX_129
 def op_and(a: int, b: int) -> int:  return (a & b) & MAX_129
@@ -28,71 +35,116 @@ def op_shr(a: int, s: int) -> int:
     if not (0 <= s <= 128): raise ValueError("shift out of range (0..128)")
     return a >> s
 
+# Edge values rand_overlong() picks from 90% of the time (built once, not per call)
+RAND_EDGES = (
+    0, 1, 2, 3, 0xFF,
+    (1 << 64) - 1, (1 << 64),
+    (1 << 127) - 1, (1 << 127), (1 << 127) + 1,
+    MAX_128 - 1, MAX_128, MAX_128 + 1,
+    TWO_POW_128 - 1, TWO_POW_128, TWO_POW_128 + 1,
+    MAX_129 - 1, MAX_129
+)
+
 def rand_overlong() -> int:
-    r = random.random()
-    if r < 0.10:
-        return random.getrandbits(129)
-    choices = [
-        0, 1, 2, 3, 0xFF,
-        (1 << 64) - 1, (1 << 64),
-        (1 << 127) - 1, (1 << 127), (1 << 127) + 1,
-        MAX_128 - 1, MAX_128, MAX_128 + 1,
-        TWO_POW_128 - 1, TWO_POW_128, TWO_POW_128 + 1,
-        MAX_129 - 1, MAX_129
-    ]
-    return random.choice(choices)
+    # choice() rather than a batched choices(k=N): the latter draws differently and
+    # would reshuffle the committed fixture
+    if _random() < 0.10:
+        return _getrandbits(129)
+    return _choice(RAND_EDGES)
+
+# Fixed SHL/SHR inputs, paired with every interesting shift; encoded once
+SHIFT_EDGES = (
+    0, 1, 2, 3, 0xFF, (1 << 63) - 1, (1 << 63), (1 << 127) - 1, (1 << 127), (1 << 127) + 1,
+    MAX_128, MAX_128 + 1, TWO_POW_128, TWO_POW_128 + 1, MAX_129 - 1, MAX_129
+)
+SHIFT_EDGE_HEX = {a: encode_overlong_hex(a) for a in SHIFT_EDGES}
 
 def interesting_shifts(): return [0,1,7,8,15,16,31,32,63,64,127,128]
 
-def build():
+def build_tests():
+    # Tests are kept as (input, operation, argument, output) tuples; build() and
+    # write_suite() turn them into JSON objects or text once, after shuffling
     tests = []
+    rng.seed(SEED)  # the same suite however often this runs in one process
+
+    # Operands for each batch are drawn up front, in the same order the former
+    # per-test loops drew them, then every test of the batch is built in one pass
 
     # INV
-    for _ in range(500):
-        a = rand_overlong()
-        tests.append({"input": encode_overlong_hex(a), "operation": "INV", "argument": None,
-                      "output": encode_overlong_hex(op_inv(a))})
+    inv_in = [rand_overlong() for _ in range(500)]
+    tests.extend((encode_overlong_hex(a), "INV", None, encode_overlong_hex(op_inv(a))) for a in inv_in)
 
     # AND/OR/XOR
-    for _ in range(800):
-        a, b = rand_overlong(), rand_overlong()
-        tests.append({"input": encode_overlong_hex(a), "operation": "AND",
-                      "argument": encode_overlong_hex(b), "output": encode_overlong_hex(op_and(a,b))})
-    for _ in range(800):
-        a, b = rand_overlong(), rand_overlong()
-        tests.append({"input": encode_overlong_hex(a), "operation": "OR",
-                      "argument": encode_overlong_hex(b), "output": encode_overlong_hex(op_or(a,b))})
-    for _ in range(800):
-        a, b = rand_overlong(), rand_overlong()
-        tests.append({"input": encode_overlong_hex(a), "operation": "XOR",
-                      "argument": encode_overlong_hex(b), "output": encode_overlong_hex(op_xor(a,b))})
+    for name, op in (("AND", op_and), ("OR", op_or), ("XOR", op_xor)):
+        operands = [(rand_overlong(), rand_overlong()) for _ in range(800)]
+        tests.extend((encode_overlong_hex(a), name, encode_overlong_hex(b), encode_overlong_hex(op(a, b)))
+                     for a, b in operands)
 
     # SHL/SHR across edge shifts, plus randoms
     for s in interesting_shifts():
-        edges = [0,1,2,3,0xFF,(1<<63)-1,(1<<63),(1<<127)-1,(1<<127),(1<<127)+1,
-                 MAX_128, MAX_128+1, TWO_POW_128, TWO_POW_128+1, MAX_129-1, MAX_129]
-        for a in edges:
-            tests.append({"input": encode_overlong_hex(a), "operation": "SHL",
-                          "argument": str(s), "output": encode_overlong_hex(op_shl(a,s))})
-            tests.append({"input": encode_overlong_hex(a), "operation": "SHR",
-                          "argument": str(s), "output": encode_overlong_hex(op_shr(a,s))})
+        arg = str(s)
+        for a in SHIFT_EDGES:  # not the dict: MAX_128 + 1 and TWO_POW_128 both appear
+            a_hex = SHIFT_EDGE_HEX[a]
+            tests.append((a_hex, "SHL", arg, encode_overlong_hex(op_shl(a,s))))
+            tests.append((a_hex, "SHR", arg, encode_overlong_hex(op_shr(a,s))))
         for _ in range(50):
             a = rand_overlong()
-            tests.append({"input": encode_overlong_hex(a), "operation": "SHL",
-                          "argument": str(s), "output": encode_overlong_hex(op_shl(a,s))})
+            tests.append((encode_overlong_hex(a), "SHL", arg, encode_overlong_hex(op_shl(a,s))))
             a = rand_overlong()
-            tests.append({"input": encode_overlong_hex(a), "operation": "SHR",
-                          "argument": str(s), "output": encode_overlong_hex(op_shr(a,s))})
+            tests.append((encode_overlong_hex(a), "SHR", arg, encode_overlong_hex(op_shr(a,s))))
+
+    rng.shuffle(tests)
+    return tests
 
-    random.shuffle(tests)
+ENCODING = "big-endian; 16 bytes if < 2^128 else 17 bytes"
+
+def build():
     return {
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": GEN_AT,
         "width_bits": 129,
-        "encoding": "big-endian; 16 bytes if < 2^128 else 17 bytes",
-        "tests": tests
+        "encoding": ENCODING,
+        "tests": [{"input": i, "operation": o, "argument": arg, "output": x} for i, o, arg, x in build_tests()]
     }
 
+# Without orjson: every test has the same shape and only ASCII hex, operation names and
+# shift counts as values, so the json.dump(indent=2) layout is filled in directly
+# rather than run through the pure-Python encoder
+TEST_TEMPLATE = (
+    '    {\n'
+    '      "input": "%s",\n'
+    '      "operation": "%s",\n'
+    '      "argument": %s,\n'
+    '      "output": "%s"\n'
+    '    }'
+)
+
+def write_suite(f, tests):
+    """
+    Writes the same text as json.dump(build(), f, indent=2), one test at a time
+    from the tuples, so the document is never held in memory whole.
+    """
+    f.write(
+        '{\n'
+        f'  "generated_at": {json.dumps(GEN_AT)},\n'
+        '  "width_bits": 129,\n'
+        f'  "encoding": {json.dumps(ENCODING)},\n'
+    )
+    if not tests:
+        f.write('  "tests": []\n}')
+        return
+    f.write('  "tests": [\n')
+    f.writelines((",\n" if n else "") + TEST_TEMPLATE % (i, o, "null" if arg is None else f'"{arg}"', x)
+                 for n, (i, o, arg, x) in enumerate(tests))
+    f.write('\n  ]\n}')
+
+def main(argv=None):
+    argparse.ArgumentParser(description="Generate 129-bit overlong operation cases.").parse_args(argv)
+    out = "../cidre/src/jvmTest/resources/pythontest/overlongs.json"
+    if FAST_JSON:
+        write_json(out, build())
+    else:
+        with open(out, "w", encoding="utf-8") as f:
+            write_suite(f, build_tests())
+
 if __name__ == "__main__":
-    suite = build()
-    with open("../cidre/src/jvmTest/resources/pythontest/overlongs.json", "w", encoding="utf-8") as f:
-        json.dump(suite, f, indent=2)
+    main()
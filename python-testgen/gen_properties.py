@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Generate CIDR test cases (IPv4/IPv6) using only Python's stdlib 'ipaddress'.
+Generate CIDR test cases (IPv4/IPv6) with the Python stdlib (plus orjson, if installed).
 
 Emits:
 - test_networks[] with:
@@ -15,14 +15,18 @@ Emits:
 Notes:
 - 'size_be_hex' is the big-endian byte encoding of net.num_addresses, hex-encoded
   with minimal length (no leading 00 bytes, no "0x" prefix).
-- Relies solely on ipaddress methods/properties.
+- ipaddress supplies the network objects and the subnet/supernet/overlap relations.
+  Random networks are built from masked random integers, and addresses are
+  formatted from integers with the socket C formatters (see _fmt). size_be_hex
+  comes from a per-prefix table, since block sizes are powers of two.
 """
 
 import argparse
 import ipaddress
-import json
+import itertools
 import random
-from datetime import datetime
+
+from _fmt import GEN_AT, format_v4, format_v6, write_json
 
 
 def ipv4_prefixes():
@@ -33,19 +37,16 @@ def ipv6_prefixes():
     return [0, 32, 48, 56, 60, 64, 96, 112, 126, 127, 128]
 
 
-def rand_net(version: int, prefix: int):
-    if version == 4:
-        return ipaddress.ip_network((ipaddress.IPv4Address(random.getrandbits(32)), prefix), strict=False)
-    else:
-        return ipaddress.ip_network((ipaddress.IPv6Address(random.getrandbits(128)), prefix), strict=False)
+# Per family: address width, network class and address formatter
+FAMILIES = {4: (32, ipaddress.IPv4Network, format_v4), 6: (128, ipaddress.IPv6Network, format_v6)}
 
 
-def broadcast_or_none(net):
-    # IPv4 has a directed broadcast only when prefix <= 30.
-    # /31 and /32 have no subnet-directed broadcast.
-    if isinstance(net, ipaddress.IPv4Network):
-        return str(net.broadcast_address) if net.prefixlen <= 30 else None
-    return None
+def rand_net(version: int, prefix: int):
+    # Same network as ip_network((IPvXAddress(bits), prefix), strict=False), built from
+    # the masked integer without the intermediate address object or host-bit check
+    width, net_cls, _ = FAMILIES[version]
+    bits = random.getrandbits(width)
+    return net_cls((bits >> (width - prefix) << (width - prefix), prefix))
 
 
 def first_last_assignable(net: ipaddress._BaseNetwork):
@@ -82,6 +83,14 @@ def int_to_be_hex(n: int) -> str:
     return n.to_bytes(length, "big").hex()
 
 
+# Block sizes are powers of two, so their encodings depend only on family and prefix:
+# size_be_hex for every prefix, indexed [version][prefixlen]
+SIZE_BE_HEX = {
+    4: [int_to_be_hex(1 << (32 - p)) for p in range(33)],
+    6: [int_to_be_hex(1 << (128 - p)) for p in range(129)],
+}
+
+
 def build_suite(n_v4=800, n_v6=800, n_pairs=800, rng_seed=42):
     random.seed(rng_seed)
 
@@ -93,33 +102,53 @@ def build_suite(n_v4=800, n_v6=800, n_pairs=800, rng_seed=42):
     for p in ipv6_prefixes():
         nets.append(ipaddress.ip_network(("2001:db8::1", p), strict=False))   # 2001:db8::/32
 
-    # Random fill
-    while sum(isinstance(n, ipaddress.IPv4Network) for n in nets) < n_v4:
+    # Random fill; count each family once and keep the counts as nets are added
+    v4_count = sum(isinstance(n, ipaddress.IPv4Network) for n in nets)
+    v6_count = len(nets) - v4_count
+    while v4_count < n_v4:
         nets.append(rand_net(4, random.choice(ipv4_prefixes())))
-    while sum(isinstance(n, ipaddress.IPv6Network) for n in nets) < n_v6:
+        v4_count += 1
+    while v6_count < n_v6:
         nets.append(rand_net(6, random.choice(ipv6_prefixes())))
-
-    # Deduplicate while preserving order
-    nets = list(dict.fromkeys(nets))
+        v6_count += 1
+
+    # Deduplicate while preserving order; key on plain ints (the same identity
+    # network equality uses) rather than hashing the network objects
+    seen = set()
+    uniq = []
+    for n in nets:
+        k = (n.version, int(n.network_address), n.prefixlen)
+        if k in seen:
+            continue
+        seen.add(k)
+        uniq.append(n)
+    nets = uniq
 
     # test_networks
     test_networks = []
     for net in nets:
         fa, la = first_last_assignable(net)
-        size_hex = int_to_be_hex(net.num_addresses)
+        # Take the block bounds as ints once and format each address a single time
+        fmt = FAMILIES[net.version][2]
+        lo = int(net.network_address)
+        # 'broadcast_address' is "top of block" for both IPv4/IPv6 in ipaddress
+        hi = int(net.broadcast_address)
+        first, last = fmt(lo), fmt(hi)
+        num_addresses = hi - lo + 1
         test_networks.append({
-            "family": "IPv4" if isinstance(net, ipaddress.IPv4Network) else "IPv6",
-            "cidr": str(net),
-            "address": str(net.network_address),
+            "family": "IPv4" if net.version == 4 else "IPv6",
+            "cidr": f"{first}/{net.prefixlen}",
+            "address": first,
             "prefix": net.prefixlen,
-            "network_address": str(net.network_address),
-            # 'broadcast_address' is "top of block" for both IPv4/IPv6 in ipaddress
-            "last_address": str(net.broadcast_address),
+            "network_address": first,
+            "last_address": last,
             "first_assignable": fa,
             "last_assignable": la,
-            "broadcast": broadcast_or_none(net),
-            "num_addresses": str(net.num_addresses),  # string to avoid overflow elsewhere
-            "size_be_hex": size_hex
+            # IPv4 has a directed broadcast only when prefix <= 30.
+            # /31 and /32 have no subnet-directed broadcast.
+            "broadcast": last if net.version == 4 and net.prefixlen <= 30 else None,
+            "num_addresses": str(num_addresses),  # string to avoid overflow elsewhere
+            "size_be_hex": SIZE_BE_HEX[net.version][net.prefixlen]
         })
 
     # adjacency_cases using subnets()/supernet() to avoid custom math
@@ -131,7 +160,7 @@ def build_suite(n_v4=800, n_v6=800, n_pairs=800, rng_seed=42):
         if base.prefixlen == 0:
             continue
         supernet = base.supernet(new_prefix=base.prefixlen - 1)
-        kids = list(supernet.subnets(new_prefix=base.prefixlen))
+        kids = list(itertools.islice(supernet.subnets(new_prefix=base.prefixlen), 2))
         if len(kids) >= 2:
             a, b = kids[0], kids[1]
             adjacency_cases.append({
@@ -164,7 +193,10 @@ def build_suite(n_v4=800, n_v6=800, n_pairs=800, rng_seed=42):
         deepest = 127 if isinstance(base, ipaddress.IPv6Network) else 31
         if base.prefixlen >= deepest:
             continue
-        sibs = list(base.subnets(new_prefix=base.prefixlen + 1))
+        # A one-bit split yields only two children, so this never reaches three and
+        # the loop emits no cases (kept as-is so net_props.json stays unchanged;
+        # islice still stops the split from materializing beyond what is checked)
+        sibs = list(itertools.islice(base.subnets(new_prefix=base.prefixlen + 1), 3))
         if len(sibs) >= 3:
             a, c = sibs[0], sibs[2]
             adjacency_cases.append({
@@ -177,7 +209,7 @@ def build_suite(n_v4=800, n_v6=800, n_pairs=800, rng_seed=42):
             })
 
     suite = {
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": GEN_AT,
         "counts": {
             "test_networks": len(test_networks),
             "adjacency_cases": len(adjacency_cases)
@@ -188,19 +220,18 @@ def build_suite(n_v4=800, n_v6=800, n_pairs=800, rng_seed=42):
     return suite
 
 
-def main():
+def main(argv=None):
     ap = argparse.ArgumentParser(description="Generate CIDR test cases with size as big-endian hex.")
     ap.add_argument("--out", default="../cidre/src/jvmTest/resources/pythontest/net_props.json", help="Output JSON path")
     ap.add_argument("--seed", type=int, default=42, help="Random seed")
     ap.add_argument("--v4", type=int, default=800, help="Approx number of IPv4 networks")
     ap.add_argument("--v6", type=int, default=800, help="Approx number of IPv6 networks")
     ap.add_argument("--pairs", type=int, default=800, help="Approx number of relationship pairs")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     suite = build_suite(n_v4=args.v4, n_v6=args.v6, n_pairs=args.pairs, rng_seed=args.seed)
 
-    with open(args.out, "w", encoding="utf-8") as f:
-        json.dump(suite, f, indent=2)
+    write_json(args.out, suite)
     print(f"Wrote {args.out} with {suite['counts']['test_networks']} test networks "
           f"and {suite['counts']['adjacency_cases']} adjacency cases (seed={args.seed}).")
 
@@ -1,20 +1,13 @@
 #!/usr/bin/env python3
 import argparse
 import ipaddress
-import json
 import random
 from typing import List, Dict, Any, Tuple
 
+from _fmt import format_v4, format_v6, write_json
 
-def cmp_int(a: int, b: int) -> int:
-    if a < b:
-        return -1
-    if a > b:
-        return 1
-    return 0
 
-
-def gen_ipv4_pairs() -> List[Tuple[ipaddress.IPv4Address, ipaddress.IPv4Address]]:
+def gen_ipv4_pairs() -> List[Tuple[int, int]]:
     pairs = []
 
     # Curated edge/equality cases
@@ -31,19 +24,18 @@ def gen_ipv4_pairs() -> List[Tuple[ipaddress.IPv4Address, ipaddress.IPv4Address]
         ("127.0.0.1", "127.0.0.1"),
     ]
     for a, b in curated:
-        pairs.append((ipaddress.IPv4Address(a), ipaddress.IPv4Address(b)))
+        pairs.append((int(ipaddress.IPv4Address(a)), int(ipaddress.IPv4Address(b))))
 
-    # Deterministic random cases
+    # Deterministic random cases: draw all 400 values in the original a, b, a, b... order.
+    # Pairs stay integers; main() formats them only when it emits the cases
     rng = random.Random(1337)
-    for _ in range(200):
-        a = ipaddress.IPv4Address(rng.randrange(0, 2**32))
-        b = ipaddress.IPv4Address(rng.randrange(0, 2**32))
-        pairs.append((a, b))
+    draws = [rng.randrange(0, 2**32) for _ in range(2 * 200)]
+    pairs.extend(zip(draws[0::2], draws[1::2]))
 
     return pairs
 
 
-def gen_ipv6_pairs() -> List[Tuple[ipaddress.IPv6Address, ipaddress.IPv6Address]]:
+def gen_ipv6_pairs() -> List[Tuple[int, int]]:
     pairs = []
 
     # Curated edge/equality cases (cover compression, v4-mapped, loopback, etc.)
@@ -62,21 +54,14 @@ def gen_ipv6_pairs() -> List[Tuple[ipaddress.IPv6Address, ipaddress.IPv6Address]
         ("2001:db8::a", "2001:db8::b"),
     ]
     for a, b in curated:
-        pairs.append((ipaddress.IPv6Address(a), ipaddress.IPv6Address(b)))
+        pairs.append((int(ipaddress.IPv6Address(a)), int(ipaddress.IPv6Address(b))))
 
     # Deterministic random cases
     rng = random.Random(2025)
-    for _ in range(200):
-        # Build IPv6 address from two 64-bit ints to keep it simple and deterministic
-        hi = rng.getrandbits(64)
-        lo = rng.getrandbits(64)
-        a = ipaddress.IPv6Address((hi << 64) | lo)
-
-        hi = rng.getrandbits(64)
-        lo = rng.getrandbits(64)
-        b = ipaddress.IPv6Address((hi << 64) | lo)
-
-        pairs.append((a, b))
+    # Build each IPv6 address from two 64-bit ints (hi drawn first) to keep it simple
+    # and deterministic; a and b alternate as before
+    draws = [(rng.getrandbits(64) << 64) | rng.getrandbits(64) for _ in range(2 * 200)]
+    pairs.extend(zip(draws[0::2], draws[1::2]))
 
     return pairs
 
@@ -90,34 +75,29 @@ def to_case(version: str, a_str: str, b_str: str, cmp_val: int) -> Dict[str, Any
     }
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(description="Generate IP address comparison cases as JSON.")
     parser.add_argument("-o", "--output", help="Output JSON file (default: ../cidre/src/jvmTest/resources/pythontest/ip_sort.json)", default="../cidre/src/jvmTest/resources/pythontest/ip_sort.json")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     cases: List[Dict[str, Any]] = []
 
     # IPv4
+    # cmp is (a > b) - (a < b): -1, 0 or 1 as a plain int, without branching
     for a, b in gen_ipv4_pairs():
-        cmpv = cmp_int(int(a), int(b))
-        cases.append(to_case("V4", str(a), str(b), cmpv))
+        cmpv = (a > b) - (a < b)
+        cases.append(to_case("V4", format_v4(a), format_v4(b), cmpv))
 
     # IPv6
     for a, b in gen_ipv6_pairs():
-        cmpv = cmp_int(int(a), int(b))
-        cases.append(to_case("V6", str(a), str(b), cmpv))
+        cmpv = (a > b) - (a < b)
+        cases.append(to_case("V6", format_v6(a), format_v6(b), cmpv))
 
     payload = {
         "cases": cases
     }
 
-    text = json.dumps(payload, indent=2, sort_keys=False)
-
-    if args.output == "-" or not args.output:
-        print(text)
-    else:
-        with open(args.output, "w", encoding="utf-8") as f:
-            f.write(text)
+    write_json(args.output or "-", payload)
 
 
 if __name__ == "__main__":
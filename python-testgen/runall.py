@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Regenerate the fixed-seed fixtures in ../cidre/src/jvmTest/resources/pythontest
+by running the independent generators side by side, one process each.
+
+Covers gen_overlongs, gen_properties, ip_sort, gen_merge_cases and gen_netmask, all
+with their default options. gen_containment (which has its own --jobs pool and
+--scale presets) and extract_python_tests (which needs a CPython test file) are
+still run on their own.
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import gen_merge_cases
+import gen_netmask
+import gen_overlongs
+import gen_properties
+import ip_sort
+
+# Each generator's main(argv); an empty argv means its defaults
+GENERATORS = {
+    "gen_overlongs": gen_overlongs.main,
+    "gen_properties": gen_properties.main,
+    "ip_sort": ip_sort.main,
+    "gen_merge_cases": gen_merge_cases.main,
+    "gen_netmask": gen_netmask.main,
+}
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Run the fixed-seed fixture generators in parallel.")
+    ap.add_argument("--jobs", type=int, default=len(GENERATORS), help="Worker processes (default: one per generator, 0 = one per CPU)")
+    args = ap.parse_args(argv)
+
+    # The generators' default output paths are relative to this directory
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    # 0 means one per CPU, as for gen_containment and extract_python_tests
+    with ProcessPoolExecutor(max_workers=args.jobs or None) as ex:
+        futures = [ex.submit(run, []) for run in GENERATORS.values()]
+        # Re-raise a generator's exception here rather than dropping it
+        for fut in futures:
+            fut.result()
+
+
+if __name__ == "__main__":
+    main()